@@ -8,35 +8,107 @@ Supports individual files and batch conversion of entire directories.
 import os
 import sys
 import argparse
+import queue
+import signal
+import threading
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Tuple
 import subprocess
 import shutil
 
-# Supported input audio formats
-SUPPORTED_FORMATS = {
-    '.mp3', '.wav', '.flac', '.m4a', '.aac', '.ogg', 
+# Optional in-process encoder (--engine=lameenc); ffmpeg remains the default
+try:
+    import lameenc
+    import soundfile
+except ImportError:
+    lameenc = soundfile = None
+
+# Supported input audio formats (lowercase; compare against suffix.lower())
+SUPPORTED_FORMATS = frozenset({
+    '.mp3', '.wav', '.flac', '.m4a', '.aac', '.ogg',
     '.opus', '.wma', '.aiff', '.ape', '.ac3', '.mp2'
-}
+})
+
+# Formats the lameenc engine can decode in-process via soundfile
+LAMEENC_FORMATS = frozenset({'.wav', '.flac', '.aiff'})
 
 class AudioConverter:
-    def __init__(self, output_dir: str = None, overwrite: bool = False, keep_structure: bool = True):
+    def __init__(self, output_dir: str = None, overwrite: bool = False, keep_structure: bool = True,
+                 jobs: int = 1, max_queue: int = 0, engine: str = 'ffmpeg'):
         """
         Initialize the audio converter.
-        
+
         Args:
             output_dir: Directory for converted files (None = same as input)
             overwrite: Whether to overwrite existing files
             keep_structure: Keep directory structure when converting folders
+            jobs: Number of files to convert in parallel
+            max_queue: Max queued jobs waiting for a worker (0 = unbounded)
+            engine: 'ffmpeg' (default), 'lameenc' for in-process encoding
+                of wav/flac/aiff inputs without spawning a subprocess, or
+                'pipe' to stream ffmpeg-decoded PCM into a lame process
         """
         self.output_dir = output_dir
         self.overwrite = overwrite
         self.keep_structure = keep_structure
+        self.jobs = max(1, jobs)
+        self.max_queue = max(0, max_queue)
+        self.engine = engine
+        if engine == 'lameenc' and (lameenc is None or soundfile is None):
+            raise RuntimeError(
+                "--engine=lameenc requires the lameenc and soundfile packages:\n"
+                "  pip install lameenc soundfile"
+            )
+        self._lame = shutil.which('lame') if engine == 'pipe' else None
+        if engine == 'pipe' and not self._lame:
+            raise RuntimeError(
+                "--engine=pipe requires the lame encoder:\n"
+                "  Ubuntu/Debian: sudo apt-get install lame\n"
+                "  macOS: brew install lame"
+            )
+        self._bitrate_cache: Dict[Path, int] = {}
+        self._mkdir_cache = set()  # Output dirs already created this run
+        self._affinity = threading.local()  # Per-worker CPU set for ffmpeg children
+        self._children = set()  # Live child processes, for interrupt teardown
+        self._children_lock = threading.Lock()
+        self._stop = threading.Event()  # Set once interrupt teardown begins
         self._check_ffmpeg()
+
+        # Static portions of the ffmpeg command, built once instead of per file.
+        # Cap ffmpeg's own thread count so parallel jobs don't oversubscribe the CPU.
+        threads = max(1, (os.cpu_count() or 1) // self.jobs)
+        self._ffmpeg_base = (
+            self._ffmpeg,  # Absolute path: no PATH search per spawn
+            '-hide_banner',
+            '-loglevel', 'error',  # stderr carries real errors only
+            '-nostats',
+            '-threads', str(threads),
+            '-probesize', '32k',  # Trim input analysis on startup
+            '-analyzeduration', '0',
+            '-fflags', '+nobuffer',
+        )
+        self._ffmpeg_tail = (
+            '-vn',  # No video
+            '-ar', '44100',  # Sample rate
+            '-ac', '2',  # Stereo
+            '-b:a', '320k',  # Bitrate
+            '-map', 'a',  # Map audio stream
+            '-map_metadata', '0',  # Copy metadata
+            '-id3v2_version', '3',  # ID3v2.3 tags
+        )
+        self._ffmpeg_copy_tail = (
+            '-vn',
+            '-c:a', 'copy',  # Stream copy: no decode/encode
+            '-map', 'a',
+            '-map_metadata', '0',  # Copy metadata
+            '-id3v2_version', '3',  # ID3v2.3 tags
+        )
     
     def _check_ffmpeg(self):
-        """Check if ffmpeg is available."""
-        if not shutil.which('ffmpeg'):
+        """Check if ffmpeg is available and cache its absolute path."""
+        self._ffmpeg = shutil.which('ffmpeg')
+        self._ffprobe = shutil.which('ffprobe')
+        if not self._ffmpeg:
             raise RuntimeError(
                 "ffmpeg not found. Please install ffmpeg:\n"
                 "  Ubuntu/Debian: sudo apt-get install ffmpeg\n"
@@ -44,6 +116,50 @@ class AudioConverter:
                 "  Windows: Download from https://ffmpeg.org/download.html"
             )
     
+    @staticmethod
+    def _kill_session(process):
+        """Terminate a child started with start_new_session=True.
+
+        Children run in their own sessions, so the terminal's SIGINT
+        never reaches them — their whole process group is signalled here.
+        """
+        if process.poll() is not None:
+            return
+        try:
+            if hasattr(os, 'killpg'):
+                os.killpg(process.pid, signal.SIGTERM)
+            else:
+                process.terminate()
+        except OSError:
+            pass
+
+    def _terminate_children(self):
+        """Kill any conversion processes still running (interrupt teardown)."""
+        with self._children_lock:
+            children = list(self._children)
+        for process in children:
+            self._kill_session(process)
+
+    @staticmethod
+    def _advise_sequential(path: Path):
+        """Hint the kernel that the file is about to be read sequentially.
+
+        Lets read-ahead start before ffmpeg even opens the input, which
+        helps first-byte latency on cold-cache large files. No-op where
+        posix_fadvise isn't available (e.g. Windows/macOS).
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
     def convert_file(self, input_path: Path, output_path: Path = None) -> Tuple[bool, str]:
         """
         Convert a single audio file to 320kbps MP3.
@@ -57,11 +173,14 @@ class AudioConverter:
         """
         input_path = Path(input_path)
         
-        # Validate input file
-        if not input_path.exists():
+        # Validate input file (EAFP: one stat call instead of exists + open)
+        try:
+            os.stat(input_path)
+        except FileNotFoundError:
             return False, f"Input file not found: {input_path}"
-        
-        if input_path.suffix.lower() not in SUPPORTED_FORMATS:
+
+        suffix = input_path.suffix.lower()
+        if suffix not in SUPPORTED_FORMATS:
             return False, f"Unsupported format: {input_path.suffix}"
         
         # Determine output path
@@ -73,66 +192,234 @@ class AudioConverter:
         else:
             output_path = Path(output_path)
         
-        # Create output directory if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create output directory if needed (once per directory per run)
+        parent = output_path.parent
+        if parent not in self._mkdir_cache:
+            os.makedirs(parent, exist_ok=True)
+            self._mkdir_cache.add(parent)
         
         # Check if output already exists
         if output_path.exists() and not self.overwrite:
-            if input_path.suffix.lower() == '.mp3':
-                # Check if it's already 320kbps
-                bitrate = self._get_bitrate(input_path)
+            if suffix == '.mp3':
+                # Check if it's already 320kbps (prefetched in directory mode)
+                if input_path in self._bitrate_cache:
+                    bitrate = self._bitrate_cache[input_path]
+                else:
+                    bitrate = self._get_bitrate(input_path)
                 if bitrate and bitrate >= 320:
                     return False, f"Skipped (already 320kbps): {input_path.name}"
             return False, f"Skipped (file exists): {output_path.name}"
-        
-        # Build ffmpeg command
-        # -i: input file
-        # -vn: no video
-        # -ar: audio sample rate (44100 Hz)
-        # -ac: audio channels (2 for stereo)
-        # -b:a: audio bitrate (320k)
-        # -y: overwrite output file
+
+        # Fast path: an mp3 already at >=320kbps needs no re-encode —
+        # hardlink it into place (copy across filesystems) instead of
+        # paying for a full decode+encode cycle.
+        if suffix == '.mp3' and input_path != output_path:
+            if input_path in self._bitrate_cache:
+                bitrate = self._bitrate_cache[input_path]
+            else:
+                bitrate = self._get_bitrate(input_path)
+            if bitrate and bitrate >= 320:
+                try:
+                    if output_path.exists():
+                        output_path.unlink()
+                    os.link(input_path, output_path)
+                    return True, f"Copied (already 320kbps): {input_path.name} → {output_path.name}"
+                except OSError:
+                    # Cross-device or unprivileged: remux with -c:a copy,
+                    # which rewrites the container/tags but never re-encodes
+                    cmd = [
+                        *self._ffmpeg_base,
+                        '-i', str(input_path),
+                        *self._ffmpeg_copy_tail,
+                        '-y',
+                        str(output_path),
+                    ]
+                    return self._run_ffmpeg(cmd, input_path, output_path,
+                                            action='Copied (already 320kbps)')
+
+        # In-process encode: no fork/exec, and lameenc releases the GIL
+        # inside libmp3lame, so workers encode truly in parallel
+        if self.engine == 'lameenc' and suffix in LAMEENC_FORMATS:
+            return self._convert_with_lameenc(input_path, output_path)
+
+        # Fused decode→encode: ffmpeg streams raw PCM into lame so the
+        # two halves of a transcode overlap on two cores per file
+        if self.engine == 'pipe':
+            return self._convert_with_pipe(input_path, output_path)
+
+        # Build ffmpeg command from the precomputed templates; only the
+        # input/output paths (and -y when overwriting) vary per file
         cmd = [
-            'ffmpeg',
+            *self._ffmpeg_base,
             '-i', str(input_path),
-            '-vn',  # No video
-            '-ar', '44100',  # Sample rate
-            '-ac', '2',  # Stereo
-            '-b:a', '320k',  # Bitrate
-            '-map', 'a',  # Map audio stream
-            '-map_metadata', '0',  # Copy metadata
-            '-id3v2_version', '3',  # ID3v2.3 tags
+            *self._ffmpeg_tail,
+            *(('-y',) if self.overwrite else ()),
+            str(output_path),
         ]
-        
-        if self.overwrite:
-            cmd.append('-y')
-        
-        cmd.append(str(output_path))
-        
+
+        self._advise_sequential(input_path)
+        return self._run_ffmpeg(cmd, input_path, output_path)
+
+    def _run_ffmpeg(self, cmd: List[str], input_path: Path, output_path: Path,
+                    action: str = 'Converted') -> Tuple[bool, str]:
+        """Spawn an ffmpeg command and fold its exit into (success, message)."""
+        if self._stop.is_set():
+            return False, f"Aborted: {input_path.name}"
         try:
-            # Run conversion
-            result = subprocess.run(
+            # Popen (rather than run) lets the worker drain stderr and reap
+            # the child without an extra bookkeeping layer.
+            process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,  # Progress output is noise; don't buffer it
                 stderr=subprocess.PIPE,
-                text=True,
-                check=False
+                bufsize=1 << 20,  # Large pipe buffer: fewer read syscalls
+                executable=self._ffmpeg,
+                start_new_session=True  # Own session; killed via _kill_session on interrupt
             )
-            
-            if result.returncode == 0:
-                return True, f"Converted: {input_path.name} → {output_path.name}"
+
+            # Pin the child to this worker's CPU slice (Linux only) so
+            # parallel ffmpeg processes spread across cores/sockets.
+            # Done from the parent: preexec_fn is unsafe with threads and
+            # would force the slow fork path over posix_spawn.
+            cpus = getattr(self._affinity, 'cpus', None)
+            if cpus and hasattr(os, 'sched_setaffinity'):
+                try:
+                    os.sched_setaffinity(process.pid, cpus)
+                except OSError:
+                    pass  # Child may already have exited; run unpinned
+            with self._children_lock:
+                self._children.add(process)
+            if self._stop.is_set():
+                # Teardown ran between Popen and registration; this child
+                # is invisible to it, so kill it ourselves
+                self._kill_session(process)
+            try:
+                stderr = process.stderr.read()
+                returncode = process.wait()
+            except BaseException:
+                # Interrupted while the child was running: take it down,
+                # since its own session shields it from terminal SIGINT
+                self._kill_session(process)
+                raise
+            finally:
+                with self._children_lock:
+                    self._children.discard(process)
+
+            if returncode == 0:
+                return True, f"{action}: {input_path.name} → {output_path.name}"
             else:
-                return False, f"Conversion failed: {input_path.name}\n{result.stderr}"
-        
+                # Decode stderr only on failure, keeping just the tail
+                return False, (f"Conversion failed: {input_path.name}\n"
+                               f"{stderr.decode('utf-8', 'replace')[-4096:]}")
+
         except Exception as e:
             return False, f"Error converting {input_path.name}: {str(e)}"
     
+    def _convert_with_lameenc(self, input_path: Path, output_path: Path) -> Tuple[bool, str]:
+        """
+        Encode to 320kbps MP3 in-process via libmp3lame (lameenc).
+
+        Skips the fork+exec+ffmpeg-init cost entirely, which dominates
+        runtime for small files. Metadata tags are not carried over.
+        """
+        try:
+            samples, sample_rate = soundfile.read(
+                str(input_path), dtype='int16', always_2d=True
+            )
+            encoder = lameenc.Encoder()
+            encoder.set_bit_rate(320)
+            encoder.set_in_sample_rate(sample_rate)
+            encoder.set_channels(samples.shape[1])
+            encoder.set_quality(2)  # 2 = high quality
+
+            data = encoder.encode(samples.tobytes())
+            data += encoder.flush()
+            with open(output_path, 'wb') as f:
+                f.write(data)
+            return True, f"Converted: {input_path.name} → {output_path.name}"
+        except Exception as e:
+            return False, f"Error converting {input_path.name}: {str(e)}"
+
+    def _convert_with_pipe(self, input_path: Path, output_path: Path) -> Tuple[bool, str]:
+        """
+        Decode with ffmpeg and pipe raw PCM straight into lame.
+
+        Decode and encode run as separate processes connected by a pipe,
+        so a heavy transcode (e.g. a large FLAC) uses two cores instead
+        of serializing both stages inside one ffmpeg process.
+        """
+        if self._stop.is_set():
+            return False, f"Aborted: {input_path.name}"
+        self._advise_sequential(input_path)
+        try:
+            decoder = subprocess.Popen(
+                [
+                    self._ffmpeg,
+                    '-hide_banner', '-loglevel', 'error', '-nostats',
+                    '-i', str(input_path),
+                    '-vn',
+                    '-f', 's16le',  # Raw signed 16-bit little-endian PCM
+                    '-ar', '44100',
+                    '-ac', '2',
+                    '-',
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+            encoder = subprocess.Popen(
+                [
+                    self._lame,
+                    '-b', '320',
+                    '-r', '--signed', '--bitwidth', '16', '--little-endian',
+                    '-s', '44.1',
+                    '--silent',
+                    '-',  # PCM from stdin
+                    str(output_path),
+                ],
+                stdin=decoder.stdout,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                start_new_session=True
+            )
+            with self._children_lock:
+                self._children.update((decoder, encoder))
+            if self._stop.is_set():
+                # Teardown ran between Popen and registration
+                self._kill_session(encoder)
+                self._kill_session(decoder)
+            try:
+                # Close our copy so the encoder sees EOF when the decoder exits
+                decoder.stdout.close()
+                stderr = encoder.stderr.read()
+                encoder_rc = encoder.wait()
+                decoder_rc = decoder.wait()
+            except BaseException:
+                self._kill_session(encoder)
+                self._kill_session(decoder)
+                raise
+            finally:
+                with self._children_lock:
+                    self._children.discard(decoder)
+                    self._children.discard(encoder)
+
+            if encoder_rc == 0 and decoder_rc == 0:
+                return True, f"Converted: {input_path.name} → {output_path.name}"
+            return False, (f"Conversion failed: {input_path.name}\n"
+                           f"{stderr.decode('utf-8', 'replace')[-4096:]}")
+        except Exception as e:
+            return False, f"Error converting {input_path.name}: {str(e)}"
+
     def _get_bitrate(self, file_path: Path) -> int:
         """Get the bitrate of an audio file in kbps."""
+        if not self._ffprobe:
+            return None
         try:
             cmd = [
-                'ffprobe',
+                self._ffprobe,
                 '-v', 'error',
+                '-probesize', '32k',  # Keep probe startup cheap
+                '-analyzeduration', '0',
                 '-show_entries', 'format=bit_rate',
                 '-of', 'default=noprint_wrappers=1:nokey=1',
                 str(file_path)
@@ -143,63 +430,190 @@ class AudioConverter:
         except:
             pass
         return None
+
+    def _prefetch_bitrates(self, paths: List[Path]) -> Dict[Path, int]:
+        """
+        Probe bitrates for .mp3 inputs up front and cache them.
+
+        Only .mp3 files can hit the already-320kbps skip branch, and only
+        when overwrite is off, so everything else is left unprobed.
+        """
+        if not self.overwrite:
+            for path in paths:
+                if path.suffix.lower() == '.mp3' and path not in self._bitrate_cache:
+                    bitrate = self._get_bitrate(path)
+                    if bitrate is not None:
+                        self._bitrate_cache[path] = bitrate
+        return self._bitrate_cache
     
-    def convert_directory(self, input_dir: Path, recursive: bool = True) -> List[Tuple[bool, str]]:
+    def convert_directory(self, input_dir: Path, recursive: bool = True) -> Iterator[Tuple[bool, str]]:
         """
         Convert all audio files in a directory.
-        
+
         Args:
             input_dir: Path to input directory
             recursive: Whether to process subdirectories
-        
-        Returns:
-            List of (success, message) tuples for each file
+
+        Yields:
+            (success, message) tuples as each file finishes, so callers
+            can fold counts without holding every result in memory
         """
         input_dir = Path(input_dir)
-        
+
         if not input_dir.exists():
-            return [(False, f"Directory not found: {input_dir}")]
-        
+            yield (False, f"Directory not found: {input_dir}")
+            return
+
         if not input_dir.is_dir():
-            return [(False, f"Not a directory: {input_dir}")]
+            yield (False, f"Not a directory: {input_dir}")
+            return
         
-        # Find all audio files
-        pattern = '**/*' if recursive else '*'
+        # Find all audio files in a single traversal
         audio_files = []
-        
-        for ext in SUPPORTED_FORMATS:
-            audio_files.extend(input_dir.glob(f"{pattern}{ext}"))
-            audio_files.extend(input_dir.glob(f"{pattern}{ext.upper()}"))
-        
+
+        # Hot loop: filter with C-implemented os.path on strings and only
+        # build Path objects for files that are actually audio
+        if recursive:
+            for root, _, files in os.walk(input_dir):
+                for name in files:
+                    if os.path.splitext(name)[1].lower() in SUPPORTED_FORMATS:
+                        audio_files.append(Path(os.path.join(root, name)))
+        else:
+            with os.scandir(input_dir) as entries:
+                for entry in entries:
+                    if (entry.is_file()
+                            and os.path.splitext(entry.name)[1].lower() in SUPPORTED_FORMATS):
+                        audio_files.append(Path(entry.path))
+
         if not audio_files:
-            return [(False, f"No audio files found in: {input_dir}")]
-        
+            yield (False, f"No audio files found in: {input_dir}")
+            return
+
         # Sort files for consistent processing
-        audio_files = sorted(set(audio_files))
+        audio_files.sort()
         
-        results = []
         print(f"\nFound {len(audio_files)} audio file(s) to convert...\n")
-        
-        for i, audio_file in enumerate(audio_files, 1):
-            print(f"[{i}/{len(audio_files)}] Processing: {audio_file.name}")
-            
-            # Determine output path
-            if self.output_dir:
-                output_dir = Path(self.output_dir)
+
+        # Probe all .mp3 inputs once so convert_file doesn't fork ffprobe per file
+        self._prefetch_bitrates(audio_files)
+
+        # Precompute (input, output) pairs before dispatching, doing the
+        # path munging with os.path on strings rather than Path methods
+        output_dir = os.fspath(self.output_dir) if self.output_dir else None
+        input_dir_str = os.fspath(input_dir)
+        jobs = []
+        for audio_file in audio_files:
+            mp3_name = os.path.splitext(os.fspath(audio_file))[0] + '.mp3'
+            if output_dir:
                 if self.keep_structure and recursive:
                     # Preserve directory structure
-                    rel_path = audio_file.relative_to(input_dir)
-                    output_path = output_dir / rel_path.with_suffix('.mp3')
+                    rel_path = os.path.relpath(mp3_name, input_dir_str)
+                    output_path = os.path.join(output_dir, rel_path)
                 else:
-                    output_path = output_dir / f"{audio_file.stem}.mp3"
+                    output_path = os.path.join(output_dir, os.path.basename(mp3_name))
             else:
-                output_path = audio_file.with_suffix('.mp3')
-            
-            success, message = self.convert_file(audio_file, output_path)
-            results.append((success, message))
-            print(f"  → {message}")
-        
-        return results
+                output_path = mp3_name
+            jobs.append((audio_file, Path(output_path)))
+
+        total = len(jobs)
+        counter = [0]
+        lock = threading.Lock()
+
+        # Completed results stream back through a queue and are yielded
+        # as they arrive, rather than accumulating in an O(N) list
+        result_q = queue.Queue()
+
+        # Bounded work queue: at most self.jobs ffmpeg processes run at
+        # once, and at most self.max_queue jobs wait in line (0 = all).
+        work_q = queue.Queue(maxsize=self.max_queue)
+
+        # Dedicated logger thread: workers enqueue progress lines instead
+        # of contending on the stdio lock; output is flushed in batches.
+        log_q = queue.Queue()
+
+        def logger():
+            pending = 0
+            while True:
+                try:
+                    line = log_q.get(timeout=0.1)
+                except queue.Empty:
+                    if pending:
+                        sys.stdout.flush()
+                        pending = 0
+                    continue
+                if line is None:  # Sentinel: shut down
+                    break
+                sys.stdout.write(line)
+                pending += 1
+                if pending >= 16:
+                    sys.stdout.flush()
+                    pending = 0
+            sys.stdout.flush()
+
+        def worker(cpus=None):
+            self._affinity.cpus = cpus
+            while True:
+                item = work_q.get()
+                if item is None or self._stop.is_set():  # Done, or teardown began
+                    break
+                audio_file, output_path = item
+                try:
+                    success, message = self.convert_file(audio_file, output_path)
+                except Exception as e:
+                    # Exactly one result per job, no matter what: a worker
+                    # dying without reporting would block the yield loop forever
+                    success, message = False, f"Error converting {audio_file.name}: {str(e)}"
+                with lock:
+                    counter[0] += 1
+                    done = counter[0]
+                log_q.put(f"[{done}/{total}] {audio_file.name}\n  → {message}\n")
+                result_q.put((success, message))
+
+        # Give each worker slot an interleaved slice of the available CPUs
+        # so ffmpeg children spread across cores (and sockets on NUMA hosts)
+        worker_count = min(self.jobs, total)
+        cpu_slices = [None] * worker_count
+        if worker_count > 1 and hasattr(os, 'sched_getaffinity'):
+            cpus = sorted(os.sched_getaffinity(0))
+            cpu_slices = [frozenset(cpus[i::worker_count]) or None
+                          for i in range(worker_count)]
+
+        workers = [threading.Thread(target=worker, args=(cpu_slices[i],), daemon=True)
+                   for i in range(worker_count)]
+        log_thread = threading.Thread(target=logger, daemon=True)
+        log_thread.start()
+        for t in workers:
+            t.start()
+
+        # Feed from a helper thread: with a bounded work queue the puts
+        # block, and doing them here would delay the first yield while
+        # finished results piled up unbounded in result_q
+        def feeder():
+            for job in jobs:
+                work_q.put(job)
+            for _ in workers:
+                work_q.put(None)
+
+        feed_thread = threading.Thread(target=feeder, daemon=True)
+        feed_thread.start()
+
+        try:
+            for _ in range(total):
+                yield result_q.get()
+        except BaseException:
+            # Ctrl-C (or an early generator close) lands here in the main
+            # thread; the workers' in-flight children won't see it. Raise
+            # the stop flag first so no worker spawns a fresh child after
+            # the teardown pass, then kill the in-flight sessions.
+            self._stop.set()
+            self._terminate_children()
+            raise
+
+        feed_thread.join()
+        for t in workers:
+            t.join()
+        log_q.put(None)
+        log_thread.join()
 
 
 def main():
@@ -244,6 +658,29 @@ Examples:
         help='Overwrite existing output files'
     )
     
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        help='Number of parallel conversions (default: number of CPU cores)'
+    )
+
+    parser.add_argument(
+        '--engine',
+        choices=['ffmpeg', 'lameenc', 'pipe'],
+        default='ffmpeg',
+        help='Encoder backend: ffmpeg subprocess (default), in-process '
+             'lameenc for wav/flac/aiff (requires lameenc + soundfile), '
+             'or an ffmpeg-decode-to-lame-encode pipe (requires lame)'
+    )
+
+    parser.add_argument(
+        '--max-queue',
+        type=int,
+        default=0,
+        help='Max jobs queued while all workers are busy (default: unbounded)'
+    )
+
     parser.add_argument(
         '--no-recursive',
         action='store_true',
@@ -262,7 +699,10 @@ Examples:
     converter = AudioConverter(
         output_dir=args.output,
         overwrite=args.overwrite,
-        keep_structure=not args.no_structure
+        keep_structure=not args.no_structure,
+        jobs=args.jobs if args.jobs else (os.cpu_count() or 1),
+        max_queue=args.max_queue,
+        engine=args.engine
     )
     
     input_path = Path(args.input)
@@ -276,16 +716,19 @@ Examples:
         sys.exit(0 if success else 1)
     
     elif input_path.is_dir():
-        # Directory conversion
-        results = converter.convert_directory(input_path, recursive=not args.no_recursive)
-        
-        # Print summary
-        successful = sum(1 for success, _ in results if success)
-        failed = len(results) - successful
-        
+        # Directory conversion: fold counts as results stream in instead
+        # of materializing the whole result list
+        total = successful = failed = 0
+        for success, _ in converter.convert_directory(input_path, recursive=not args.no_recursive):
+            total += 1
+            if success:
+                successful += 1
+            else:
+                failed += 1
+
         print(f"\n{'='*60}")
         print(f"Conversion Summary:")
-        print(f"  Total files: {len(results)}")
+        print(f"  Total files: {total}")
         print(f"  Successful: {successful}")
         print(f"  Failed/Skipped: {failed}")
         print(f"{'='*60}")